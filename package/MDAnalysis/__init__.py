@@ -194,7 +194,7 @@ from .exceptions import (
 from .lib import log
 from .lib.log import start_logging, stop_logging
 
-logging.getLogger("MDAnalysis").addHandler(log.NullHandler())
+logging.getLogger("MDAnalysis").addHandler(logging.NullHandler())
 del logging
 
 # only MDAnalysis DeprecationWarnings are loud by default
@@ -32,7 +32,6 @@ Read and write coordinates in CHARMM CARD coordinate format (suffix
 from __future__ import absolute_import
 
 from six.moves import zip, range
-from six import raise_from
 
 import itertools
 import numpy as np
@@ -43,12 +42,40 @@ from ..lib import util
 from . import base
 
 
+def _number_residues(resids):
+    """Running residue number (TotRes) for each atom.
+
+    Residues are numbered from 1 in the order in which they appear; a new
+    residue starts whenever the resid differs from that of the previous
+    atom.
+
+    Parameters
+    ----------
+    resids : numpy.ndarray
+        resid of each atom
+
+    Returns
+    -------
+    numpy.ndarray
+        residue number of each atom
+    """
+    totres = np.ones(len(resids), dtype=np.int64)
+    totres[1:] += np.cumsum(resids[1:] != resids[:-1])
+    return totres
+
+
 class CRDReader(base.SingleFrameReaderBase):
     """CRD reader that implements the standard and extended CRD coordinate formats
 
     .. versionchanged:: 0.11.0
        Now returns a ValueError instead of FormatError.
        Frames now 0-based instead of 1-based.
+
+    .. versionchanged:: 0.21.0
+       Coordinates are parsed from their fixed width columns all at once,
+       from a memory map of the file if all records have the same length
+       or otherwise with a single call to :func:`numpy.genfromtxt`,
+       instead of line by line.
     """
     format = 'CRD'
     units = {'time': None, 'length': 'Angstrom'}
@@ -62,36 +89,66 @@ class CRDReader(base.SingleFrameReaderBase):
         #      (i5) natoms
         #      (2I5,1X,A4,1X,A4,3F10.5,1X,A4,1X,A4,F10.5)
         #      iatom,ires,resn,typr,x,y,z,segid,orig_resid,wmain
-        coords_list = []
         with util.openany(self.filename) as crdfile:
+            # Header: the TITLE lines are followed by exactly one natoms line
             extended = False
             natoms = 0
+            start = 0
             for linenum, line in enumerate(crdfile):
-                if line.strip().startswith('*') or line.strip() == "":
+                line = line.strip()
+                if line.startswith('*') or line == "":
                     continue  # ignore TITLE and empty lines
                 fields = line.split()
-                if len(fields) <= 2:
-                    # should be the natoms line
-                    natoms = int(fields[0])
-                    extended = (fields[-1] == 'EXT')
-                    continue
-                # process coordinates
-                try:
-                    if extended:
-                        coords_list.append(np.array(line[45:100].split()[0:3], dtype=float))
-                    else:
-                        coords_list.append(np.array(line[20:50].split()[0:3], dtype=float))
-                except Exception:
-                    raise_from(
-                        ValueError(
-                            "Check CRD format at line {0}: {1}"
-                            "".format(linenum, line.rstrip())),
-                        None
-                        )
-
-        self.n_atoms = len(coords_list)
-
-        self.ts = self._Timestep.from_coordinates(np.array(coords_list),
+                if len(fields) > 2:
+                    raise ValueError(
+                        "Check CRD format at line {0}: expected the number "
+                        "of atoms but found {1}".format(linenum, line))
+                natoms = int(fields[0])
+                extended = (fields[-1] == 'EXT')
+                start = linenum + 1
+                break
+
+            # The coordinates are fixed width Fortran fields (3F20.10
+            # starting at column 40 for EXT, 3F10.5 starting at column 20
+            # otherwise) so that all atom records can be parsed at once,
+            # either straight from a memory map of the file or by
+            # streaming the remaining lines into a single genfromtxt call.
+            if extended:
+                widths = (40, 20, 20, 20)
+            else:
+                widths = (20, 10, 10, 10)
+            coords = None
+            if natoms > 0 and not util.isstream(self.filename):
+                coords = self._read_fixed_records(start, natoms, widths)
+            if coords is None:
+                # Body: the remaining (non-empty) lines are the atom records
+                atomlines = (line for line in crdfile if line.strip())
+                first = next(atomlines, None)
+                if first is not None:
+                    coords = np.genfromtxt(
+                        itertools.chain((first,), atomlines),
+                        delimiter=widths, usecols=(1, 2, 3),
+                        dtype=np.float64, comments=None)
+                    coords = coords.reshape(-1, 3)
+                else:
+                    coords = np.zeros((0, 3), dtype=np.float64)
+
+        # genfromtxt fills anything it cannot convert with NaN; only then go
+        # back to the file to report the offending line
+        invalid = np.isnan(coords).any(axis=1)
+        if invalid.any():
+            with util.openany(self.filename) as crdfile:
+                atomlines = ((linenum, line)
+                             for linenum, line in enumerate(crdfile)
+                             if linenum >= start and line.strip())
+                linenum, line = next(itertools.islice(
+                    atomlines, int(np.argmax(invalid)), None))
+            raise ValueError("Check CRD format at line {0}: {1}"
+                             "".format(linenum, line.rstrip()))
+
+        self.n_atoms = len(coords)
+
+        self.ts = self._Timestep.from_coordinates(coords,
                                                   **self._ts_kwargs)
         self.ts.frame = 0  # 0-based frame number
         # if self.convert_units:
@@ -102,6 +159,44 @@ class CRDReader(base.SingleFrameReaderBase):
             raise ValueError("Found %d coordinates in %r but the header claims that there "
                               "should be %d coordinates." % (self.n_atoms, self.filename, natoms))
 
+    def _read_fixed_records(self, start, natoms, widths):
+        """Parse the atom records from a memory map of the file.
+
+        This requires an uncompressed file in which the `natoms` records
+        following the first `start` lines all have the same length (as
+        written by CHARMM and MDAnalysis) and nothing but whitespace follows
+        them.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            coordinates or ``None`` if the file does not have this layout
+        """
+        with open(self.filename, 'rb') as crdfile:
+            for _ in range(start):
+                crdfile.readline()
+            offset = crdfile.tell()
+            reclen = len(crdfile.readline())
+            crdfile.seek(offset + natoms * reclen)
+            if crdfile.read().strip():
+                return None
+        first, width = widths[0], widths[1]
+        if reclen <= first + 3 * width:
+            return None
+        try:
+            records = np.memmap(self.filename, dtype='S1', mode='r',
+                                offset=offset, shape=(natoms, reclen))
+        except ValueError:
+            # file is shorter than natoms records
+            return None
+        if not (records[:, -1] == b'\n').all():
+            return None
+        columns = np.ascontiguousarray(records[:, first:first + 3 * width])
+        try:
+            return columns.view('S{0}'.format(width)).astype(np.float64)
+        except ValueError:
+            return None
+
     def Writer(self, filename, **kwargs):
         """Returns a CRDWriter for *filename*.
 
@@ -137,18 +232,18 @@ class CRDWriter(base.WriterBase):
     format = 'CRD'
     units = {'time': None, 'length': 'Angstrom'}
 
+    # ATOM records use positional %-formatting, which is considerably
+    # cheaper per atom than str.format with keyword arguments
     fmt = {
         #crdtype = 'extended'
         #fortran_format = '(2I10,2X,A8,2X,A8,3F20.10,2X,A8,2X,A8,F20.10)'
-        "ATOM_EXT": ("{serial:10d}{totRes:10d}  {resname:<8.8s}  {name:<8.8s}"
-                     "{pos[0]:20.10f}{pos[1]:20.10f}{pos[2]:20.10f}  "
-                     "{chainID:<8.8s}  {resSeq:<8d}{tempfactor:20.10f}\n"),
+        "ATOM_EXT": ("%10d%10d  %-8.8s  %-8.8s%20.10f%20.10f%20.10f  "
+                     "%-8.8s  %-8d%20.10f\n"),
         "NUMATOMS_EXT": "{0:10d} EXT\n",
         #crdtype = 'standard'
         #fortran_format = '(2I5,1X,A4,1X,A4,3F10.5,1X,A4,1X,A4,F10.5)'
-        "ATOM": ("{serial:5d}{totRes:5d} {resname:<4.4s} {name:<4.4s}"
-                 "{pos[0]:10.5f}{pos[1]:10.5f}{pos[2]:10.5f} "
-                 "{chainID:<4.4s} {resSeq:<4d}{tempfactor:10.5f}\n"),
+        "ATOM": ("%5d%5d %-4.4s %-4.4s%10.5f%10.5f%10.5f "
+                 "%-4.4s %-4d%10.5f\n"),
         "TITLE": "* FRAME {frame} FROM {where}\n",
         "NUMATOMS": "{0:5d}\n",
     }
@@ -189,34 +284,32 @@ class CRDWriter(base.WriterBase):
         coor = atoms.positions  # can write from selection == Universe (Issue 49)
 
         n_atoms = len(atoms)
-        # Detect which format string we're using to output (EXT or not)
-        # *len refers to how to truncate various things,
-        # depending on output format!
+        # Detect which format strings we're using to output (EXT or not)
+        # and how many digits of the resids fit.  The serial and the residue
+        # number (TotRes) never exceed n_atoms, so they always fit.
         if n_atoms > 99999:
             at_fmt = self.fmt['ATOM_EXT']
-            serial_len = 10
+            numatoms_fmt = self.fmt['NUMATOMS_EXT']
             resid_len = 8
-            totres_len = 10
         else:
             at_fmt = self.fmt['ATOM']
-            serial_len = 5
+            numatoms_fmt = self.fmt['NUMATOMS']
             resid_len = 4
-            totres_len = 5
 
-        # Check for attributes, use defaults for missing ones
+        # Check for attributes, use defaults for missing ones; every
+        # attribute ends up as an array with one entry per atom
         attrs = {}
         missing_topology = []
         for attr, default in (
-                ('resnames', itertools.cycle(('UNK',))),
-                # Resids *must* be an array because we index it later
-                ('resids', np.ones(n_atoms, dtype=np.int)),
-                ('names', itertools.cycle(('X',))),
-                ('tempfactors', itertools.cycle((0.0,))),
+                ('resnames', 'UNK'),
+                ('resids', 1),
+                ('names', 'X'),
+                ('tempfactors', 0.0),
         ):
             try:
                 attrs[attr] = getattr(atoms, attr)
             except (NoDataError, AttributeError):
-                attrs[attr] = default
+                attrs[attr] = np.full(n_atoms, default)
                 missing_topology.append(attr)
         # ChainIDs - Try ChainIDs first, fall back to Segids
         try:
@@ -226,7 +319,7 @@ class CRDWriter(base.WriterBase):
             try:
                 attrs['chainIDs'] = atoms.segids
             except (NoDataError, AttributeError):
-                attrs['chainIDs'] = itertools.cycle(('',))
+                attrs['chainIDs'] = np.full(n_atoms, '')
                 missing_topology.append(attr)
         if missing_topology:
             warnings.warn(
@@ -234,34 +327,37 @@ class CRDWriter(base.WriterBase):
                 "{miss}. These will be written with default values. "
                 "".format(miss=', '.join(missing_topology)))
 
+        # The whole file is assembled in memory and written in one go
+        # Title
+        parts = [self.fmt['TITLE'].format(
+            frame=frame, where=u.trajectory.filename), "*\n"]
+
+        # NUMATOMS
+        parts.append(numatoms_fmt.format(n_atoms))
+
+        # All atoms
+        resids = np.asarray(attrs['resids'])
+        totres = _number_residues(resids)
+        serials = np.arange(1, n_atoms + 1)
+
+        # Truncate resids that do not fit
+        resseqs = resids.tolist()
+        for i in np.flatnonzero((resids < 0) | (resids >= 10**resid_len)):
+            resseqs[i] = util.ltruncate_int(resseqs[i], resid_len)
+
+        # Rows are formatted column-wise from plain Python lists, which
+        # is much cheaper than formatting numpy scalars
+        parts.extend(
+            at_fmt % (serial, current_resid, resname, name, x, y, z,
+                      chainID, resid, tempfactor)
+            for (serial, current_resid, (x, y, z), resname, name,
+                 chainID, resid, tempfactor) in zip(
+                serials.tolist(), totres.tolist(), coor.tolist(),
+                np.asarray(attrs['resnames']).tolist(),
+                np.asarray(attrs['names']).tolist(),
+                np.asarray(attrs['chainIDs']).tolist(),
+                resseqs,
+                np.asarray(attrs['tempfactors']).tolist()))
+
         with util.openany(self.filename, 'w') as crd:
-            # Write Title
-            crd.write(self.fmt['TITLE'].format(
-                frame=frame, where=u.trajectory.filename))
-            crd.write("*\n")
-
-            # Write NUMATOMS
-            if n_atoms > 99999:
-                crd.write(self.fmt['NUMATOMS_EXT'].format(n_atoms))
-            else:
-                crd.write(self.fmt['NUMATOMS'].format(n_atoms))
-
-            # Write all atoms
-
-            current_resid = 1
-            resids = attrs['resids']
-            for i, pos, resname, name, chainID, resid, tempfactor in zip(
-                    range(n_atoms), coor, attrs['resnames'], attrs['names'],
-                    attrs['chainIDs'], attrs['resids'], attrs['tempfactors']):
-                if not i == 0 and resids[i] != resids[i-1]:
-                    current_resid += 1
-
-                # Truncate numbers
-                serial = util.ltruncate_int(i + 1, serial_len)
-                resid = util.ltruncate_int(resid, resid_len)
-                current_resid = util.ltruncate_int(current_resid, totres_len)
-
-                crd.write(at_fmt.format(
-                    serial=serial, totRes=current_resid, resname=resname,
-                    name=name, pos=pos, chainID=chainID,
-                    resSeq=resid, tempfactor=tempfactor))
+            crd.write("".join(parts))
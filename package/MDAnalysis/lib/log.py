@@ -84,9 +84,14 @@ from __future__ import print_function, division, absolute_import
 
 import sys
 import logging
+# NullHandler used to be defined here; the standard library one is
+# identical and remains available as MDAnalysis.lib.log.NullHandler
+from logging import NullHandler
 import re
 import warnings
 
+import six
+
 from .. import version
 
 
@@ -108,11 +113,14 @@ def stop_logging():
     clear_handlers(logger)  # this _should_ do the job...
 
 
-def create(logger_name="MDAnalysis", logfile="MDAnalysis.log"):
+def create(logger_name="MDAnalysis", logfile="MDAnalysis.log",
+           console=True):
     """Create a top level logger.
 
     - The file logger logs everything (including DEBUG).
-    - The console logger only logs INFO and above.
+    - The console logger only logs INFO and above. It is only added if
+      `console` is ``True``; without it every record is only formatted
+      and emitted once, for the logfile.
 
     Logging to a file and the console as described under `logging to
     multiple destinations`_.
@@ -124,6 +132,9 @@ def create(logger_name="MDAnalysis", logfile="MDAnalysis.log"):
 
     .. _logging to multiple destinations:
        http://docs.python.org/library/logging.html?#logging-to-multiple-destinations
+
+    .. versionchanged:: 0.21.0
+       Added keyword argument `console`.
     """
 
     logger = logging.getLogger(logger_name)
@@ -136,13 +147,14 @@ def create(logger_name="MDAnalysis", logfile="MDAnalysis.log"):
     logfile_handler.setFormatter(logfile_formatter)
     logger.addHandler(logfile_handler)
 
-    # define a Handler which writes INFO messages or higher to the sys.stderr
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    # set a format which is simpler for console use
-    formatter = logging.Formatter('%(name)-12s: %(levelname)-8s %(message)s')
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    if console:
+        # define a Handler which writes INFO messages or higher to the sys.stderr
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        # set a format which is simpler for console use
+        formatter = logging.Formatter('%(name)-12s: %(levelname)-8s %(message)s')
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
 
     return logger
 
@@ -157,22 +169,6 @@ def clear_handlers(logger):
         logger.removeHandler(h)
 
 
-class NullHandler(logging.Handler):
-    """Silent Handler.
-
-    Useful as a default::
-
-      h = NullHandler()
-      logging.getLogger("MDAnalysis").addHandler(h)
-      del h
-
-    see the advice on logging and libraries in
-    http://docs.python.org/library/logging.html?#configuring-logging-for-a-library
-    """
-    def emit(self, record):
-        pass
-
-
 def echo(s='', replace=False, newline=True):
     r"""Simple string output that immediately prints to the console.
 
@@ -202,8 +198,13 @@ def echo(s='', replace=False, newline=True):
 
 def _new_format(template, variables):
     """Format a string that follows the {}-based syntax.
+
+    On Python 3 the `variables` mapping is used directly with
+    :meth:`str.format_map` instead of being copied into keyword arguments.
     """
-    return template.format(**variables)
+    if six.PY2:
+        return template.format(**variables)
+    return template.format_map(variables)
 
 
 def _legacy_format(template, variables):
@@ -323,13 +324,21 @@ class ProgressMeter(object):
     .. deprecated:: 0.16
        Keyword argument *quiet* is deprecated in favor of *verbose*.
 
+    .. versionchanged:: 0.21.0
+       Raises :exc:`ValueError` instead of :exc:`AssertionError` if
+       *numsteps* or *interval* are not positive.
+
     """
 
     def __init__(self, numsteps, format=None, interval=10, offset=1,
                  verbose=True, dynamic=True,
                  format_handling='auto'):
-        self.numsteps = numsteps
+        self.numsteps = int(numsteps)
         self.interval = int(interval)
+        if self.numsteps <= 0:
+            raise ValueError("numsteps step must be >0")
+        if self.interval <= 0:
+            raise ValueError("interval step must be >0")
         self.offset = int(offset)
         self.verbose = verbose
         self.dynamic = dynamic
@@ -347,8 +356,8 @@ class ProgressMeter(object):
         self.format = format
         self.step = 0
         self.percentage = 0.0
-        assert numsteps > 0, "numsteps step must be >0"
-        assert interval > 0, "interval step must be >0"
+        # factor to turn a step into a percentage of numsteps
+        self._scale = 100. / self.numsteps
 
     def update(self, step, **kwargs):
         """Update the state of the ProgressMeter.
@@ -357,7 +366,7 @@ class ProgressMeter(object):
         the format string.
         """
         self.step = step + self.offset
-        self.percentage = 100. * self.step / self.numsteps
+        self.percentage = self.step * self._scale
         for k, v in kwargs.items():
             setattr(self, k, v)
 
@@ -366,6 +375,8 @@ class ProgressMeter(object):
     def echo(self, step, **kwargs):
         """Print the state to stderr, but only every *interval* steps.
 
+        If the state is due to be shown, it
+
         1) calls :meth:`~ProgressMeter.update`
         2) writes step and percentage to stderr with :func:`echo`,
            using the format string (in :attr:`ProgressMeter.format`)
@@ -380,17 +391,19 @@ class ProgressMeter(object):
                   constructor or if :attr:`ProgressMeter.verbose` has
                   been set to ``False``, then no messages will be
                   printed.
+
+        .. versionchanged:: 0.21.0
+           The state (including *kwargs*) is only updated on the steps
+           that are shown.
         """
         if not self.verbose:
             return
-        self.update(step, **kwargs)
-        format = self.format
-        newline = not self.dynamic
-        if self.step == self.numsteps:
-            newline = True
-        elif self.numouts % self.interval == 0:
-            pass
-        else:
+        # decide before updating the state because most calls print nothing
+        last = step + self.offset == self.numsteps
+        if not last and (self.numouts + 1) % self.interval:
+            self.numouts += 1
             return
-        echo(self.format_handler(format, vars(self)),
-             replace=self.dynamic, newline=newline)
+        self.update(step, **kwargs)
+        # vars(self) is the instance __dict__ itself, not a copy
+        echo(self.format_handler(self.format, vars(self)),
+             replace=self.dynamic, newline=last or not self.dynamic)
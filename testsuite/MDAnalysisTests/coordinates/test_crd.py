@@ -28,6 +28,7 @@ from collections import OrderedDict
 import pytest
 from numpy.testing import (
     assert_equal,
+    assert_allclose,
 )
 
 import MDAnalysis as mda
@@ -36,6 +37,49 @@ from MDAnalysisTests.datafiles import CRD
 from MDAnalysisTests import make_Universe
 
 
+class TestCRDReader(object):
+    EXT = ("* TITLE\n"
+           "*\n"
+           "         2  EXT\n"
+           "         1         1  MET       N       "
+           "      -11.9210000000       26.3070000000       10.4100000000"
+           "  4AKE      1               0.0000000000\n"
+           "         2         1  MET       HT1     "
+           "      -11.4470000000       26.7410000000        9.5950000000"
+           "  4AKE      1               0.0000000000\n")
+
+    @pytest.fixture()
+    def infile(self, tmpdir):
+        return str(tmpdir) + '/in.crd'
+
+    @pytest.mark.parametrize('content', [
+        EXT,
+        # records of different length cannot be read from a memory map
+        EXT.replace('0.0000000000\n', '0.0000000000   \n', 1),
+    ])
+    def test_read_EXT(self, infile, content):
+        with open(infile, 'w') as crd:
+            crd.write(content)
+        u = mda.Universe(infile)
+
+        assert len(u.atoms) == 2
+        assert_allclose(u.atoms.positions,
+                        [[-11.921, 26.307, 10.41],
+                         [-11.447, 26.741, 9.595]], rtol=1e-6)
+
+    def test_bad_coordinates(self, infile):
+        with open(infile, 'w') as crd:
+            crd.write(self.EXT.replace('26.7410000000', '26.74x0000000'))
+        with pytest.raises(ValueError, match='Check CRD format at line 4'):
+            mda.coordinates.CRD.CRDReader(infile)
+
+    def test_missing_natoms(self, infile):
+        with open(infile, 'w') as crd:
+            crd.write(self.EXT.replace("         2  EXT\n", ""))
+        with pytest.raises(ValueError, match='expected the number of atoms'):
+            mda.coordinates.CRD.CRDReader(infile)
+
+
 class TestCRDWriter(object):
     @pytest.fixture()
     def u(self):
@@ -69,6 +113,21 @@ class TestCRDWriter(object):
         for ref, other in zip(CRD_iter(CRD), CRD_iter(outfile)):
             assert ref == other
 
+    def test_totres(self, outfile):
+        # TotRes counts every change of resid, even if a resid reappears
+        u = mda.Universe.empty(6, n_residues=4,
+                               atom_resindex=[0, 0, 1, 1, 2, 3],
+                               trajectory=True)
+        u.add_TopologyAttr('resids', [5, 3, 5, 7])
+        u.atoms.write(outfile)
+
+        with open(outfile) as inf:
+            atomlines = [line for line in inf
+                         if not line.startswith('*')][1:]
+        totres = [int(line[5:10]) for line in atomlines]
+
+        assert totres == [1, 1, 2, 2, 3, 4]
+
     def test_write_EXT(self):
         # TODO: Write tests that use EXT output format
         # Must have *lots* of atoms, maybe fake the system
@@ -43,6 +43,19 @@ def test_start_stop_logging():
         MDAnalysis.log.stop_logging()
 
 
+@pytest.mark.parametrize('console, n_handlers', [(True, 2), (False, 1)])
+def test_create_console(tmpdir, console, n_handlers):
+    logfile = str(tmpdir.join('test.log'))
+    logger = MDAnalysis.lib.log.create("MDAnalysis.test_create",
+                                       logfile=logfile, console=console)
+    try:
+        assert len(logger.handlers) == n_handlers
+    finally:
+        for h in list(logger.handlers):
+            h.close()
+            logger.removeHandler(h)
+
+
 class RedirectedStderr(object):
     """Temporarily replaces sys.stderr with *stream*.
 
@@ -143,3 +156,12 @@ def test_not_dynamic_ProgressMeter(buffer, step, percentage, n=51, interval=10):
     buffer.seek(0)
     output = "".join(buffer.readlines())
     _assert_in(output, (template + '\n').format(**{'step': step, 'numsteps': n, 'percentage': percentage}))
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'numsteps': 0},
+    {'numsteps': 10, 'interval': 0},
+])
+def test_ProgressMeter_invalid(kwargs):
+    with pytest.raises(ValueError):
+        MDAnalysis.lib.log.ProgressMeter(**kwargs)